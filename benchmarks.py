@@ -0,0 +1,85 @@
+"""Times and measures the batched array math of hypercomplex. Run from the repo root: python benchmarks.py"""
+
+import timeit
+import random
+import tracemalloc
+import numpy as np
+from hypercomplex import O, arrays, cayley_dickson_algebra
+from hypercomplex.fractals import plane, mandelbrot
+from hypercomplex.lazy import lazy
+
+DTYPES = np.float32, np.float64, np.complex64, np.complex128
+
+
+def best_time(function, repeat=5):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def benchmark_dtypes(count=100_000):
+    """Prints the memory use and multiplication and fractal throughput of octonion arrays for each dtype."""
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, count, O.dimensions))
+
+    tracemalloc.start()
+    numbers = O.from_array(x[:1000])
+    object_bytes = tracemalloc.get_traced_memory()[0] / len(numbers)
+    tracemalloc.stop()
+    seconds = best_time(lambda: [a * b for a, b in zip(numbers, numbers)], 1)
+    print(f"{'dtype':<12}{'bytes/number':>14}{'products/s':>14}{'mandelbrot points/s':>22}")
+    print(f"{'objects':<12}{object_bytes:>14.0f}{len(numbers) / seconds:>14.3g}{'-':>22}")
+
+    grid = plane(O, np.linspace(-2, 1, 200), np.linspace(-1.5, 1.5, 200))
+    for dtype in DTYPES:
+        a, b = arrays.coefficients(O, x, dtype), arrays.coefficients(O, y, dtype)
+        seconds = best_time(lambda: arrays.multiply(a, b))
+        fractal_seconds = best_time(lambda: mandelbrot(O, grid, max_iterations=50, dtype=dtype), 2)
+        print(f"{np.dtype(dtype).name:<12}{a.nbytes / count:>14.0f}{count / seconds:>14.3g}"
+              f"{grid[..., 0].size / fractal_seconds:>22.3g}")
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark_lazy(count=100_000):
+    """Prints the time and peak memory of a*b + c*d - e.conjugate() + x.conjugate()*x computed eagerly and lazily."""
+    a, b, c, d, e, x = np.random.default_rng(0).normal(size=(6, count, O.dimensions))
+
+    def eager():
+        return (arrays.multiply(a, b) + arrays.multiply(c, d) - arrays.conjugate(e)
+                + arrays.multiply(arrays.conjugate(x), x))
+
+    def deferred():
+        return (lazy(a) * b + lazy(c) * d - lazy(e).conjugate() + lazy(x).conjugate() * lazy(x)).evaluate()
+
+    print(f"{'mode':<12}{'seconds':>14}{'peak MB':>14}")
+    for name, function in (('eager', eager), ('lazy', deferred)):
+        print(f"{name:<12}{best_time(function):>14.4f}{peak_memory(function) / 2**20:>14.1f}")
+
+
+def benchmark_karatsuba(levels=range(6, 11), karatsuba_level=6):
+    """Prints the seconds per multiplication of standard and karatsuba_multiply numbers at each level."""
+    print(f"{'level':<12}{'standard':>14}{'karatsuba':>14}{'speedup':>14}")
+    for level in levels:
+        standard = cayley_dickson_algebra(level)
+        karatsuba = cayley_dickson_algebra(level, karatsuba_level=karatsuba_level)
+        x, y = ([random.random() for _ in range(2**level)] for _ in range(2))
+        repeat = 3 if level < 9 else 1
+        a, b = standard(*x), standard(*y)
+        standard_seconds = best_time(lambda: a * b, repeat)
+        a, b = karatsuba(*x), karatsuba(*y)
+        karatsuba_seconds = best_time(lambda: a * b, repeat)
+        print(f"{level:<12}{standard_seconds:>14.4f}{karatsuba_seconds:>14.4f}"
+              f"{standard_seconds / karatsuba_seconds:>14.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_dtypes()
+    print()
+    benchmark_lazy()
+    print()
+    benchmark_karatsuba()
@@ -0,0 +1,106 @@
+"""Provides batched hypercomplex math on NumPy arrays whose last axis holds the coefficients of each number.
+
+Arrays may have any real dtype, e.g. float32 uses half the memory of float64 but only has about 7 significant digits
+rather than 16. Complex dtypes use the complex pair layout where each complex entry holds two neighboring coefficients,
+so an array of n-dimensional numbers has n/2 complex entries. complex64 and complex128 have the same precision and
+memory use as float32 and float64 but multiply faster because the Cayley-Dickson recursion stops at complex numbers.
+Results in either layout are equal up to rounding. Every function here works with both layouts."""
+
+import numpy as np
+
+
+def to_pairs(x):
+    """Returns real layout x in the complex pair layout. No copy is made if x is C-contiguous floating point."""
+    x = np.ascontiguousarray(x, np.result_type(x, np.float32))
+    return x.view(np.result_type(x, np.complex64))
+
+
+def from_pairs(x):
+    """Returns complex pair layout x in the real layout. No copy is made if x is C-contiguous."""
+    x = np.ascontiguousarray(x)
+    return x.view(x.real.dtype)
+
+
+def coefficients(algebra, values, dtype=None):
+    """Returns values as an array of the algebra's numbers with the given dtype. Missing coefficients become 0.
+
+    The dtype defaults to that of values if it is floating point or complex, else float64. Complex values are taken to
+    be in the complex pair layout already, e.g. a complex scalar is a single complex number."""
+    values = np.asarray(values)
+    if values.ndim == 0:
+        values = values[..., None]
+    if dtype is None:
+        dtype = values.dtype if values.dtype.kind in 'fc' else np.float64
+    dtype = np.dtype(dtype)
+    if values.dtype.kind == 'c':
+        values = from_pairs(values)
+    values = values.astype(np.empty(0, dtype).real.dtype, copy=False)
+    size = algebra.dimensions
+    if values.shape[-1] > size:
+        raise TypeError(f"Too many coefficients. Got {values.shape[-1]} expecting at most {size}.")
+    if values.shape[-1] < size:
+        padding = np.zeros(values.shape[:-1] + (size - values.shape[-1],), values.dtype)
+        values = np.concatenate((values, padding), axis=-1)
+    if dtype.kind == 'c':
+        if size == 1:
+            raise ValueError("Real numbers have no complex pair layout.")
+        values = to_pairs(values)
+    return values
+
+
+def real(x):
+    """Returns the real (leftmost) coefficients of x."""
+    return x[..., 0].real
+
+
+def conjugate(x):
+    """Returns the conjugates of x."""
+    result = -x
+    result[..., 0] = np.conj(x[..., 0])
+    return result
+
+
+def norm_squared(x):
+    """Returns the squares of the norms of x."""
+    if np.iscomplexobj(x):  # Squaring np.abs would round through a square root.
+        x = from_pairs(x)
+    return np.einsum('...i,...i->...', x, x)  # Avoids a temporary array of squares.
+
+
+def norm(x):
+    """Returns the norms of x."""
+    return np.sqrt(norm_squared(x))
+
+
+def multiply(x, y):
+    """Returns the products x*y using the recursive Cayley-Dickson formula on halves of the last axis."""
+    n = x.shape[-1]
+    if n != y.shape[-1]:
+        raise ValueError(f"Can't multiply arrays with {n} and {y.shape[-1]} coefficients.")
+    if n == 1:
+        return x * y
+    h = n // 2
+    a, b, c, d = x[..., :h], x[..., h:], y[..., :h], y[..., h:]
+    result = np.empty(np.broadcast(x, y).shape, np.result_type(x, y))
+    result[..., :h] = multiply(a, c) - multiply(conjugate(d), b)
+    result[..., h:] = multiply(d, a) + multiply(b, conjugate(c))
+    return result
+
+
+def power(x, exponent):
+    """Returns x**exponent for an integer exponent.
+
+    Every Cayley-Dickson number z = r + v with real r and imaginary v satisfies v*v == -|v|**2, so z behaves like the
+    complex number r + |v|i and z**n is found in linear time from (r + |v|i)**n rather than by repeated multiplication.
+    Like x**exponent for numbers, raises ZeroDivisionError if the exponent is negative and any of x is zero."""
+    if exponent < 0 and not np.all(np.any(x != 0, axis=-1)):
+        raise ZeroDivisionError("Zero can't be raised to a negative power.")
+    r = real(x)
+    v = x.copy()
+    v[..., 0] -= r
+    v_norm = norm(v)
+    z = (r + 1j * v_norm)**exponent
+    scale = np.divide(z.imag, v_norm, out=np.zeros_like(v_norm), where=v_norm != 0)
+    result = v * scale[..., None]
+    result[..., 0] += z.real
+    return result
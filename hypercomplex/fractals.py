@@ -0,0 +1,55 @@
+"""Provides a batched escape-time engine for Mandelbrot and Julia set slices of any hypercomplex algebra."""
+
+import numpy as np
+from hypercomplex import arrays
+
+
+def plane(algebra, xs, ys, axes=(0, 1), origin=()):
+    """Returns a 2D grid of algebra numbers with shape (len(ys), len(xs), dimensions).
+
+    The xs and ys values vary the coefficients at the two indices in axes and the other coefficients come from origin."""
+    grid = np.repeat(arrays.coefficients(algebra, origin)[None, None, :], len(ys), axis=0)
+    grid = np.repeat(grid, len(xs), axis=1)
+    grid[..., axes[0]] = np.asarray(xs)[None, :]
+    grid[..., axes[1]] = np.asarray(ys)[:, None]
+    return grid
+
+
+def escape_time(algebra, c, z=0, exponent=2, max_iterations=100, escape_radius=2.0, chunk_size=2**16, dtype=float):
+    """Iterates z -> z**exponent + c and returns the iteration on which each point's norm passed escape_radius.
+
+    The c and z arrays (or numbers) have coefficients on their last axis and are broadcast together. The result has
+    their broadcast shape minus the last axis and holds 0 for points that never escaped. Points are processed in
+    chunks of chunk_size to bound memory and escaped points are dropped from each chunk as soon as they escape.
+    The iteration is done in the given dtype, see arrays.py. Complex dtypes use the complex pair layout."""
+    c = arrays.coefficients(algebra, c, dtype)
+    z = arrays.coefficients(algebra, z, dtype)
+    shape = np.broadcast(c, z).shape
+    c = np.broadcast_to(c, shape).reshape(-1, shape[-1])
+    z = np.broadcast_to(z, shape).reshape(-1, shape[-1])
+    counts = np.zeros(len(c), dtype=int)
+    limit = escape_radius**2
+
+    for start in range(0, len(c), chunk_size):
+        active = np.arange(start, min(start + chunk_size, len(c)))
+        chunk_c, chunk_z = c[active], z[active]
+        for iteration in range(1, max_iterations + 1):
+            if not len(active):
+                break
+            chunk_z = arrays.power(chunk_z, exponent) + chunk_c
+            escaped = arrays.norm_squared(chunk_z) > limit
+            if escaped.any():
+                counts[active[escaped]] = iteration
+                remaining = ~escaped
+                active, chunk_c, chunk_z = active[remaining], chunk_c[remaining], chunk_z[remaining]
+    return counts.reshape(shape[:-1])
+
+
+def mandelbrot(algebra, c, **kwargs):
+    """Returns the escape_time counts of the Mandelbrot set for the c values, starting every z at 0."""
+    return escape_time(algebra, c, 0, **kwargs)
+
+
+def julia(algebra, z, c, **kwargs):
+    """Returns the escape_time counts of the Julia set for the constant c, starting from the z values."""
+    return escape_time(algebra, c, z, **kwargs)
@@ -3,6 +3,9 @@
 from mathdunders import mathdunders
 from numbers import Number
 from math import sqrt
+from functools import lru_cache
+from itertools import chain
+from array import array
 
 
 class Numeric(Number):
@@ -41,6 +44,18 @@ class Numeric(Number):
     def __repr__(self):
         return str(self)
 
+    def __array__(self, dtype=None, copy=None):
+        if copy is False:
+            raise ValueError("Numbers are not stored as arrays so converting them always makes a copy.")
+        import numpy  # Deferred since NumPy is optional.
+        return numpy.array(self.coefficients(), dtype)
+
+    def __buffer__(self, flags):  # Used by memoryview in Python 3.12+.
+        typecodes = {float: 'd', int: 'q'}
+        if self.base() not in typecodes:
+            raise TypeError(f"Only float and int based numbers support the buffer protocol, not {self.base().__name__}.")
+        return memoryview(array(typecodes[self.base()], self.coefficients()))
+
     def __format__(self, format_spec):
         if not format_spec:
             format_spec = "g"
@@ -79,6 +94,58 @@ class Numeric(Number):
             return '\n'.join(rows) + '\n'
         return matrix
 
+    @classmethod
+    def to_array(cls, numbers, dtype=float):
+        """Returns a NumPy array of shape (len(numbers), dimensions) of the coefficients of numbers in one pass.
+
+        A complex dtype gives the complex pair layout of shape (len(numbers), dimensions // 2) as used by arrays.py."""
+        import numpy  # Deferred since NumPy is optional.
+        dtype = numpy.dtype(dtype)
+        if dtype.kind == 'c' and cls.dimensions == 1:
+            raise ValueError("Real numbers have no complex pair layout.")
+        numbers = [n if isinstance(n, cls) else cls(n) for n in numbers]
+        coefficients = chain.from_iterable(n.coefficients() for n in numbers)
+        size = len(numbers) * cls.dimensions
+        values = numpy.fromiter(coefficients, numpy.empty(0, dtype).real.dtype, size)
+        return values.reshape(len(numbers), cls.dimensions).view(dtype)
+
+    @classmethod
+    def from_array(cls, values):
+        """Returns a number from a 1D array of coefficients, or nested lists of numbers for higher dimensional arrays.
+
+        Complex arrays are taken to be in the complex pair layout."""
+        import numpy  # Deferred since NumPy is optional.
+        values = numpy.asarray(values)
+        if values.dtype.kind == 'c':  # Complex pair layout.
+            values = numpy.ascontiguousarray(values).view(values.real.dtype)
+
+        def convert(rows, depth):
+            return cls(*rows) if depth <= 1 else [convert(row, depth - 1) for row in rows]
+        return convert(values.tolist(), values.ndim)
+
+    @classmethod
+    def e_signs(cls):
+        """Returns a 2D tuple of the signs s where e(i)*e(j) == s * e(i ^ j). Much faster than e_matrix for large types."""
+        return cayley_dickson_signs(cls.dimensions)
+
+
+@lru_cache(maxsize=None)
+def cayley_dickson_signs(dimensions):
+    """Returns the e_signs table for the Cayley-Dickson algebra with the given number of dimensions, built recursively."""
+    if dimensions == 1:
+        return ((1,),)
+    half = dimensions // 2
+    signs = cayley_dickson_signs(half)
+
+    def conjugate_sign(i):
+        return 1 if i == 0 else -1
+
+    # Follows (a, b) * (c, d) = (a*c - d.conjugate()*b, d*a + b*c.conjugate()) for single unit a, b, c, d.
+    top = [signs[i] + tuple(signs[j][i] for j in range(half)) for i in range(half)]
+    bottom = [tuple(signs[i][j] * conjugate_sign(j) for j in range(half)) +
+              tuple(-conjugate_sign(j) * signs[j][i] for j in range(half)) for i in range(half)]
+    return tuple(top + bottom)
+
 
 def reals(base=float):
     """Creates a type that represents real numbers based on a numeric type base."""
@@ -114,8 +181,11 @@ def reals(base=float):
     return Real
 
 
-def cayley_dickson_construction(basis):
-    """Creates a type for the Cayley-Dickson algebra with twice the dimensions of the given Hypercomplex or Real basis."""
+def cayley_dickson_construction(basis, karatsuba=False):
+    """Creates a type for the Cayley-Dickson algebra with twice the dimensions of the given Hypercomplex or Real basis.
+
+    If karatsuba is True the type multiplies with 3 rather than 4 multiplications of its basis, see karatsuba_multiply.
+    This can be changed later with the karatsuba attribute of the type."""
     if not hasattr(basis, 'coefficients'):
         raise ValueError(
             "The basis type must be Real or Hypercomplex. (No coefficients found.)")
@@ -233,16 +303,44 @@ def cayley_dickson_construction(basis):
             return Hypercomplex(other) + self
 
         def __mul__(self, other):
+            # Short circuit base type since real scalars scale each coefficient.
+            if isinstance(other, Hypercomplex.base()):
+                return Hypercomplex(self.a * other, self.b * other, pair=True)
             other = Hypercomplex.coerce(other)
             if other is None:
                 return NotImplemented
+            if Hypercomplex.karatsuba:
+                return self.karatsuba_multiply(other)
             a = self.a * other.a - other.b.conjugate() * self.b
             b = other.b * self.a + self.b * other.a.conjugate()
             return Hypercomplex(a, b, pair=True)
 
         def __rmul__(self, other):
+            if isinstance(other, Hypercomplex.base()):
+                return self * other
             return Hypercomplex(other) * self
 
+        def karatsuba_multiply(self, other):
+            """Returns self * other using 3 rather than 4 multiplications of the basis type.
+
+            Cayley-Dickson numbers satisfy q*p == 2*p0*q + 2*q0*p - 2*dot(p, q) - p*q where p0 and q0 are the real
+            coefficients. So swapping the order of a product or conjugating (d.conjugate() == 2*d0 - d) takes linear
+            time, and the formula (a*c - d.conjugate()*b, d*a + b*c.conjugate()) can be rewritten using only a*c - b*d
+            and a*d + b*c, which Karatsuba's (or Gauss's) trick finds from 3 multiplications."""
+            a, b, c, d = self.a, self.b, other.a, other.b
+            two = Hypercomplex.base()(2)
+
+            def anticommutator(p, q):  # Returns p*q + q*p in linear time.
+                dot = sum(x * y for x, y in zip(p.coefficients(), q.coefficients()))
+                return p * (two * q.real_coefficient()) + q * (two * p.real_coefficient()) - two * dot
+
+            k1 = (a + b) * c
+            k2 = a * (d - c)
+            k3 = b * (c + d)
+            left = (k1 - k3) - b * (two * d.real_coefficient()) + anticommutator(b, d)
+            right = anticommutator(a, d) + b * (two * c.real_coefficient()) - (k1 + k2)
+            return Hypercomplex(left, right, pair=True)
+
         def __pow__(self, other):  # Only valid if other is an integer.
             if not isinstance(other, int):
                 return NotImplemented
@@ -278,16 +376,19 @@ def cayley_dickson_construction(basis):
         def __rtruediv__(self, other):
             return Hypercomplex(other) / self
 
+    Hypercomplex.karatsuba = karatsuba
     return Hypercomplex
 
 
-def cayley_dickson_algebra(level, base=float):
-    """Creates the type for the Cayley-Dickson algebra with 2**level dimensions. e.g. 0 for Real, 1 for Complex, 2 for Quaternion."""
+def cayley_dickson_algebra(level, base=float, karatsuba_level=None):
+    """Creates the type for the Cayley-Dickson algebra with 2**level dimensions. e.g. 0 for Real, 1 for Complex, 2 for Quaternion.
+
+    If karatsuba_level is given the levels at or above it use karatsuba_multiply. It's faster from about level 6 up."""
     if not isinstance(level, int) or level < 0:
         raise ValueError("The level must be a positive integer.")
     numbers = reals(base)
-    for _ in range(level):
-        numbers = cayley_dickson_construction(numbers)
+    for i in range(1, level + 1):
+        numbers = cayley_dickson_construction(numbers, karatsuba_level is not None and i >= karatsuba_level)
     return numbers
 
 
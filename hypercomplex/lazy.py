@@ -0,0 +1,275 @@
+"""Provides lazy expressions that record hypercomplex arithmetic and compute it all at once on demand.
+
+Wrapping a number or array of numbers with lazy() makes every operator involving it build an expression graph rather
+than computing a result. evaluate() then computes the graph once, with each shared sub-expression computed only once.
+Graphs with array leaves are computed with NumPy, with temporary arrays reused in place where nothing else needs them,
+and x.conjugate() * x or x * x.conjugate() found as a norm squared, which is real and takes linear rather than
+quadratic time. Graphs of numbers alone use the numbers' own operators so any base type is kept exactly."""
+
+import numpy as np
+from hypercomplex import arrays
+
+
+class Value:
+    """The result of a node during evaluation. Real values are arrays of scalars of shape (..., 1)."""
+
+    def __init__(self, array, real=False, owned=False):
+        self.array = array
+        self.real = real
+        self.owned = owned  # If the array may be overwritten.
+
+
+class Expression:
+    """A node of a lazy expression graph. Operators on it make new nodes. Call evaluate() to compute it."""
+
+    __array_ufunc__ = None  # Makes NumPy arrays defer to the reflected operators below.
+
+    def __init__(self, operation, *operands):
+        self.operation = operation
+        self.operands = operands
+
+    def __add__(self, other):
+        return Expression('add', self, lazy(other))
+
+    def __radd__(self, other):
+        return Expression('add', lazy(other), self)
+
+    def __sub__(self, other):
+        return Expression('subtract', self, lazy(other))
+
+    def __rsub__(self, other):
+        return Expression('subtract', lazy(other), self)
+
+    def __mul__(self, other):
+        return Expression('multiply', self, lazy(other))
+
+    def __rmul__(self, other):
+        return Expression('multiply', lazy(other), self)
+
+    def __neg__(self):
+        return Expression('negate', self)
+
+    def __pos__(self):
+        return self
+
+    def conjugate(self):
+        """Returns the lazy conjugate."""
+        return Expression('conjugate', self)
+
+    def norm_squared(self):
+        """Returns the lazy square of the norm."""
+        return Expression('norm_squared', self)
+
+    def nodes(self):
+        """Returns a list of every node of the graph once, children first."""
+        nodes, seen, stack = [], set(), [(self, False)]
+        while stack:  # Iterative so long chains like s = s + x don't hit the recursion limit.
+            node, expanded = stack.pop()
+            if expanded:
+                nodes.append(node)
+            elif id(node) not in seen:
+                seen.add(id(node))
+                stack.append((node, True))
+                if node.operation != 'leaf':
+                    stack.extend((operand, False) for operand in reversed(node.operands))
+        return nodes
+
+    def rewritten(self):
+        """Returns an equal graph with each x.conjugate() * x and x * x.conjugate() replaced by x.norm_squared().
+
+        The conjugates are then left out of the graph entirely unless something else uses them."""
+        new = {}
+        for node in self.nodes():
+            if node.operation == 'leaf':
+                new[id(node)] = node
+                continue
+            operands = tuple(new[id(operand)] for operand in node.operands)
+            if node.operation == 'multiply':
+                left, right = operands
+                if left.operation == 'conjugate' and same(left.operands[0], right):
+                    new[id(node)] = Expression('norm_squared', right)
+                    continue
+                if right.operation == 'conjugate' and same(right.operands[0], left):
+                    new[id(node)] = Expression('norm_squared', left)
+                    continue
+            same_operands = all(a is b for a, b in zip(operands, node.operands))
+            new[id(node)] = node if same_operands else Expression(node.operation, *operands)
+        return new[id(self)]
+
+    def evaluate(self):
+        """Computes the expression. Returns an array if any leaf is an array, else the number the eager operators give."""
+        if not any(isinstance(node.operands[0], np.ndarray) for node in self.nodes() if node.operation == 'leaf'):
+            return self.evaluate_numbers()
+        nodes = self.rewritten().nodes()
+        root = nodes[-1]
+        leaves = [node.operands[0] for node in nodes if node.operation == 'leaf']
+        paired = any(np.iscomplexobj(leaf) for leaf in leaves if isinstance(leaf, np.ndarray))
+        uses = {}
+        for node in nodes:
+            if node.operation != 'leaf':
+                for operand in node.operands:
+                    uses[id(operand)] = uses.get(id(operand), 0) + 1
+
+        values = {}
+        for node in nodes:
+            if node.operation == 'leaf':
+                value = leaf_value(node.operands[0], paired)
+            else:
+                value = compute(node, [values[id(operand)] for operand in node.operands])
+                # Arrays are only reused in place if this node is their one consumer.
+                value.owned = value.owned and uses.get(id(node), 0) <= 1
+            values[id(node)] = value
+
+        result = values[id(root)]
+        widths = [values[id(node)].array.shape[-1] for node in nodes
+                  if node.operation == 'leaf' and not values[id(node)].real]
+        array = result.array if result.real else writable(result, result.array.shape, result.array.dtype)
+        array = pad(array, max(widths, default=1))
+        if paired:
+            array = array.astype(np.result_type(array, np.complex64), copy=False)
+        return array
+
+    def evaluate_numbers(self):
+        """Computes an expression without array leaves with the eager operators, once per node."""
+        values = {}
+        for node in self.nodes():
+            if node.operation == 'leaf':
+                value = node.operands[0]
+            else:
+                value = compute_number(node.operation, *(values[id(operand)] for operand in node.operands))
+            values[id(node)] = value
+        return values[id(self)]
+
+
+def lazy(value):
+    """Returns value as an Expression. Value can be a number, array of numbers in either layout, or Expression."""
+    return value if isinstance(value, Expression) else Expression('leaf', value)
+
+
+def leaf_value(leaf, paired):
+    if isinstance(leaf, np.ndarray):
+        if paired and not np.iscomplexobj(leaf):
+            leaf = arrays.to_pairs(pad(leaf, leaf.shape[-1] + leaf.shape[-1] % 2))
+        return Value(leaf)
+    if not hasattr(leaf, 'coefficients') and not isinstance(leaf, complex):
+        return Value(np.array([leaf], float), real=True)
+    array = np.array(leaf.coefficients() if hasattr(leaf, 'coefficients') else (leaf.real, leaf.imag), float)
+    if paired:
+        array = arrays.to_pairs(pad(array, len(array) + len(array) % 2))
+    return Value(array)
+
+
+def pad(array, width):
+    """Returns array with zeros added to the end of its last axis to make it width long."""
+    if array.shape[-1] >= width:
+        return array
+    result = np.zeros(array.shape[:-1] + (width,), array.dtype)
+    result[..., :array.shape[-1]] = array
+    return result
+
+
+def reusable(value, shape, dtype):
+    """Checks if value's array can be overwritten with a result of the given shape and dtype."""
+    return value.owned and value.array.shape == shape and value.array.dtype == dtype
+
+
+def writable(value, shape, dtype):
+    """Returns value's array as a number padded and broadcast to shape, reusing it if possible."""
+    if not value.real and reusable(value, shape, dtype):
+        return value.array
+    result = np.zeros(shape, dtype)
+    result[..., :value.array.shape[-1]] = value.array
+    return result
+
+
+def broadcast_shapes(*shapes):
+    """Returns the shape the given shapes broadcast to. Like np.broadcast_shapes, which needs NumPy 1.20+."""
+    return np.broadcast(*(np.broadcast_to(False, shape) for shape in shapes)).shape
+
+
+def broadcast_shape(x, y, width):
+    return broadcast_shapes(x.shape[:-1], y.shape[:-1]) + (width,)
+
+
+def same(x, y):
+    """Checks if two nodes are known to have equal values without evaluating them."""
+    return x is y or (x.operation == y.operation == 'leaf' and x.operands[0] is y.operands[0])
+
+
+def add(x, y, sign):
+    """Returns the Value of x + sign*y."""
+    dtype = np.result_type(x.array, y.array)
+    if x.real and y.real:
+        shape = broadcast_shapes(x.array.shape, y.array.shape)
+        out = x.array if reusable(x, shape, dtype) else None
+        return Value(np.add(x.array, sign * y.array, out=out), True, True)
+    width = max(x.array.shape[-1], y.array.shape[-1])
+    shape = broadcast_shape(x.array, y.array, width)
+    if not x.owned and y.owned:  # Reuse y's array instead, as sign*y + x.
+        out = writable(y, shape, dtype)
+        if sign < 0:
+            np.negative(out, out=out)
+        sign, y = 1, x
+    else:
+        out = writable(x, shape, dtype)
+    other = y.array
+    if y.real:
+        out[..., 0] += sign * other[..., 0]
+    elif sign > 0:
+        out[..., :other.shape[-1]] += other
+    else:
+        out[..., :other.shape[-1]] -= other
+    return Value(out, owned=True)
+
+
+def multiply(x, y):
+    """Returns the Value of x*y."""
+    if x.real or y.real:
+        scalar, number = (x, y) if x.real else (y, x)
+        shape = broadcast_shapes(number.array.shape, scalar.array.shape)
+        out = number.array if reusable(number, shape, np.result_type(x.array, y.array)) else None
+        return Value(np.multiply(number.array, scalar.array, out=out), number.real, True)
+    width = max(x.array.shape[-1], y.array.shape[-1])
+    return Value(arrays.multiply(pad(x.array, width), pad(y.array, width)), owned=True)
+
+
+def compute_number(operation, x, y=None):
+    """Returns the result of a non-leaf node's operation on numbers."""
+    if operation == 'add':
+        return x + y
+    if operation == 'subtract':
+        return x - y
+    if operation == 'multiply':
+        return x * y
+    if operation == 'negate':
+        return -x
+    if operation == 'conjugate':
+        return x.conjugate()
+    if operation == 'norm_squared':
+        return x.norm_squared() if hasattr(x, 'norm_squared') else (x * x.conjugate()).real
+    raise ValueError(f"Unknown operation {operation}.")
+
+
+def compute(node, values):
+    """Returns the Value of a non-leaf node given the Values of its operands."""
+    operation = node.operation
+    if operation == 'add':
+        return add(*values, 1)
+    if operation == 'subtract':
+        return add(*values, -1)
+    if operation == 'multiply':
+        return multiply(*values)
+    x, = values
+    if operation == 'negate':
+        return Value(np.negative(x.array, out=x.array) if x.owned else -x.array, x.real, True)
+    if operation == 'conjugate':
+        if x.real:
+            return x
+        if not x.owned:
+            return Value(arrays.conjugate(x.array), owned=True)
+        np.negative(x.array[..., 1:], out=x.array[..., 1:])
+        x.array[..., 0] = np.conj(x.array[..., 0])
+        return x
+    if operation == 'norm_squared':
+        return Value(arrays.norm_squared(x.array)[..., None], True, True)
+    raise ValueError(f"Unknown operation {operation}.")
@@ -0,0 +1,70 @@
+"""Provides polynomials with hypercomplex coefficients evaluated with Horner's rule."""
+
+
+def horner(coefficients, t, n, combine, zero):
+    """Returns (a, b) such that sum(c_k * x**k) == a + b*x given x*x == t*x - n for real t and n.
+
+    Every Cayley-Dickson number x satisfies this with t = 2*x.real and n = x.norm_squared(), so Horner's rule only needs
+    real scalings of the coefficients. combine(u, v, s) must return u + s*v. Coefficients are in increasing order."""
+    a, b = coefficients[-1], zero
+    for c in reversed(coefficients[:-1]):
+        a, b = combine(c, b, -n), combine(a, b, t)
+    return a, b
+
+
+def combine_tuples(u, v, s):
+    return tuple(p + s * q for p, q in zip(u, v))
+
+
+class Polynomial:
+    """A polynomial over an algebra with coefficients c_k in increasing order of degree, i.e. c_0 + c_1*x + c_2*x**2 + ...
+
+    Coefficients go on the left of the powers, c_k * x**k, unless right is True, giving x**k * c_k."""
+
+    def __init__(self, algebra, *coefficients, right=False):
+        self.algebra = algebra
+        self.coefficients = tuple(map(algebra, coefficients or (0,)))
+        self.right = right
+
+    @property
+    def degree(self):
+        """The index of the highest non-zero coefficient, or 0 for the zero polynomial."""
+        return max((k for k, c in enumerate(self.coefficients) if c), default=0)
+
+    def derivative(self):
+        """Returns the formal derivative polynomial with coefficients k * c_k."""
+        coefficients = [k * c for k, c in enumerate(self.coefficients)][1:]
+        return Polynomial(self.algebra, *coefficients, right=self.right)
+
+    def evaluate(self, x, derivative=False):
+        """Returns the polynomial's value at x, or a (value, derivative value) tuple if derivative is True."""
+        x = self.algebra(x)
+        t, n = 2 * x.real_coefficient(), x.norm_squared()
+        zero = (self.algebra.base()(),) * self.algebra.dimensions
+
+        def value(polynomial):
+            coefficients = [c.coefficients() for c in polynomial.coefficients]
+            a, b = map(lambda c: self.algebra(*c), horner(coefficients, t, n, combine_tuples, zero))
+            return a + (x * b if self.right else b * x)
+
+        return (value(self), value(self.derivative())) if derivative else value(self)
+
+    def evaluate_array(self, points, derivative=False):
+        """Like evaluate but for a NumPy array whose last axis holds the coefficients of each point."""
+        from hypercomplex import arrays  # Deferred since NumPy is optional.
+        points = arrays.coefficients(self.algebra, points)
+        t, n = 2 * arrays.real(points)[..., None], arrays.norm_squared(points)[..., None]
+        zero = arrays.coefficients(self.algebra, (), points.dtype)
+
+        def value(polynomial):
+            coefficients = [arrays.coefficients(self.algebra, c.coefficients(), points.dtype) for c in polynomial.coefficients]
+            a, b = horner(coefficients, t, n, lambda u, v, s: u + s * v, zero)
+            return a + (arrays.multiply(points, b) if self.right else arrays.multiply(b, points))
+
+        return (value(self), value(self.derivative())) if derivative else value(self)
+
+    def __call__(self, x):
+        return self.evaluate(x)
+
+    def __repr__(self):
+        return f"Polynomial{self.coefficients}"
@@ -0,0 +1,124 @@
+"""Test suite for arrays.py."""
+
+import sys
+import unittest
+from hypercomplex import R, C, Q, O, S, cayley_dickson_algebra
+
+try:
+    import numpy as np
+    from hypercomplex import arrays
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def random(self, T, count=4):
+        return self.rng.normal(size=(count, T.dimensions))
+
+    def assertMatches(self, array, numbers):
+        np.testing.assert_allclose(array, [n.coefficients() for n in numbers])
+
+    def test_coefficients(self):
+        self.assertEqual(arrays.coefficients(Q, [1, 2]).tolist(), [1, 2, 0, 0])
+        self.assertEqual(arrays.coefficients(C, 3).tolist(), [3, 0])
+        self.assertEqual(arrays.coefficients(C, [[1], [2]]).shape, (2, 2))
+        self.assertRaises(TypeError, arrays.coefficients, C, [1, 2, 3])
+
+    def test_dtypes(self):
+        self.assertEqual(arrays.coefficients(Q, [1, 2]).dtype, np.float64)
+        self.assertEqual(arrays.coefficients(Q, np.ones(2, np.float32)).dtype, np.float32)
+        self.assertEqual(arrays.coefficients(Q, [1, 2], np.float32).dtype, np.float32)
+        self.assertEqual(arrays.coefficients(Q, [1, 2, 3], np.complex64).tolist(), [1 + 2j, 3])
+        self.assertEqual(arrays.coefficients(Q, [1 + 2j, 3j]).tolist(), [1 + 2j, 3j])
+        self.assertEqual(arrays.coefficients(C, 1 + 2j, np.float64).tolist(), [1, 2])
+        self.assertRaises(ValueError, arrays.coefficients, R, 1, np.complex128)
+
+    def test_pairs(self):
+        x = self.random(O)
+        pairs = arrays.to_pairs(x)
+        self.assertEqual((pairs.shape, pairs.dtype), ((4, 4), np.complex128))
+        self.assertTrue(np.shares_memory(x, pairs))
+        self.assertEqual(arrays.to_pairs(x.astype(np.float32)).dtype, np.complex64)
+        np.testing.assert_array_equal(arrays.from_pairs(pairs), x)
+        self.assertTrue(np.shares_memory(arrays.from_pairs(pairs), x))
+
+    def test_complex_layout(self):
+        x, y = self.random(S), self.random(S)
+        xp, yp = arrays.to_pairs(x), arrays.to_pairs(y)
+        np.testing.assert_allclose(arrays.from_pairs(arrays.multiply(xp, yp)), arrays.multiply(x, y))
+        np.testing.assert_allclose(arrays.from_pairs(arrays.conjugate(xp)), arrays.conjugate(x))
+        np.testing.assert_allclose(arrays.from_pairs(arrays.power(xp, 3)), arrays.power(x, 3))
+        np.testing.assert_allclose(arrays.norm(xp), arrays.norm(x))
+        self.assertEqual(arrays.norm_squared(arrays.to_pairs(np.array([1.0, 1, 1, 1]))), 4.0)
+        np.testing.assert_array_equal(arrays.norm_squared(arrays.to_pairs(np.arange(8.0))), 140.0)
+        np.testing.assert_allclose(arrays.real(xp), arrays.real(x))
+
+    def test_float32(self):
+        x, y = self.random(O), self.random(O)
+        product = arrays.multiply(x.astype(np.float32), y.astype(np.float32))
+        self.assertEqual(product.dtype, np.float32)
+        np.testing.assert_allclose(product, arrays.multiply(x, y), rtol=1e-5, atol=1e-5)
+
+    def test_conjugate_norm(self):
+        x = self.random(O)
+        self.assertMatches(arrays.conjugate(x), [O(*row).conjugate() for row in x])
+        np.testing.assert_allclose(arrays.norm(x), [O(*row).norm() for row in x])
+        np.testing.assert_allclose(arrays.real(x), x[:, 0])
+
+    def test_multiply(self):
+        for T in (C, Q, O, S):
+            x, y = self.random(T), self.random(T)
+            self.assertMatches(arrays.multiply(x, y), [T(*a) * T(*b) for a, b in zip(x, y)])
+        self.assertRaises(ValueError, arrays.multiply, self.random(C), self.random(Q))
+
+    def test_power(self):
+        for T in (C, Q, S):
+            x = self.random(T)
+            for exponent in (-2, 0, 1, 2, 5):
+                self.assertMatches(arrays.power(x, exponent), [T(*row)**exponent for row in x])
+        self.assertMatches(arrays.power(np.array([[2.0, 0, 0, 0]]), 3), [Q(8)])
+        self.assertMatches(arrays.power(np.zeros((1, 4)), 0), [Q(1)])
+        self.assertRaises(ZeroDivisionError, lambda: Q()**-1)
+        self.assertRaises(ZeroDivisionError, arrays.power, np.array([[1.0, 2], [0, 0]]), -1)
+
+    def test_array_interop(self):
+        self.assertEqual(np.asarray(Q(1, 2)).tolist(), [1, 2, 0, 0])
+        self.assertEqual(np.asarray(Q(1, 2), dtype=np.float32).dtype, np.float32)
+        self.assertRaises(ValueError, Q(1, 2).__array__, copy=False)
+        self.assertEqual(Q(1, 2).__array__(copy=True).tolist(), [1, 2, 0, 0])
+        if np.lib.NumpyVersion(np.__version__) >= '2.0.0':
+            self.assertRaises(ValueError, np.asarray, Q(1, 2), copy=False)
+        self.assertEqual(np.asarray([C(1, 2), C(3)]).tolist(), [[1, 2], [3, 0]])
+        self.assertEqual(Q.to_array([Q(1, 2, 3, 4), C(5, 6), 7]).tolist(), [[1, 2, 3, 4], [5, 6, 0, 0], [7, 0, 0, 0]])
+        self.assertEqual(O.to_array([]).shape, (0, 8))
+        self.assertEqual(Q.to_array([Q(1)], np.float32).dtype, np.float32)
+        self.assertEqual(Q.to_array([Q(1, 2, 3, 4)], np.complex64).tolist(), [[1 + 2j, 3 + 4j]])
+        self.assertRaises(ValueError, R.to_array, [R(1)], np.complex128)
+
+        self.assertEqual(Q.from_array(np.array([1, 2, 3, 4])), Q(1, 2, 3, 4))
+        self.assertEqual(R.from_array([5]), R(5))
+        self.assertEqual(C.from_array([[1, 2], [3, 4]]), [C(1, 2), C(3, 4)])
+        self.assertEqual(C.from_array(np.zeros((0, 2))), [])
+        self.assertEqual(Q.from_array(np.array([1 + 2j, 3 + 4j])), Q(1, 2, 3, 4))
+        nested = Q.from_array(np.ones((2, 3, 4)))
+        self.assertEqual((len(nested), len(nested[1]), nested[1][2]), (2, 3, Q(1, 1, 1, 1)))
+        x = self.random(S)
+        np.testing.assert_array_equal(S.to_array(S.from_array(x)), x)
+
+    def test_buffer(self):
+        self.assertEqual(Q(1, 2, 3).__buffer__(0).tolist(), [1, 2, 3, 0])
+        self.assertEqual(cayley_dickson_algebra(1, int)(7, 8).__buffer__(0).format, 'q')
+        self.assertEqual(np.frombuffer(O(1, 2).__buffer__(0)).tolist(), [1, 2, 0, 0, 0, 0, 0, 0])
+        from decimal import Decimal
+        self.assertRaises(TypeError, cayley_dickson_algebra(1, Decimal)().__buffer__, 0)
+        if sys.version_info >= (3, 12):
+            self.assertEqual(memoryview(C(1, 2)).tolist(), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
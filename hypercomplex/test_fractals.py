@@ -0,0 +1,66 @@
+"""Test suite for fractals.py."""
+
+import unittest
+from hypercomplex import C, Q, O
+
+try:
+    import numpy as np
+    from hypercomplex.fractals import plane, escape_time, mandelbrot, julia
+except ImportError:
+    np = None
+
+
+def reference(T, c, z, exponent=2, max_iterations=20):
+    c, z = T(*c), T(*z)
+    for iteration in range(1, max_iterations + 1):
+        z = z**exponent + c
+        if z.norm() > 2:
+            return iteration
+    return 0
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestFractals(unittest.TestCase):
+
+    def test_plane(self):
+        grid = plane(Q, [1, 2, 3], [4, 5], axes=(1, 3), origin=(9,))
+        self.assertEqual(grid.shape, (2, 3, 4))
+        self.assertEqual(grid[1, 2].tolist(), [9, 3, 0, 5])
+
+    def test_complex_mandelbrot(self):
+        grid = plane(C, np.linspace(-2, 1, 7), np.linspace(-1, 1, 5))
+        counts = mandelbrot(C, grid, max_iterations=20)
+        expected = [[reference(C, c, (0, 0)) for c in row] for row in grid]
+        self.assertEqual(counts.tolist(), expected)
+        self.assertEqual(counts[2, 4], 0)  # The origin never escapes.
+
+    def test_quaternion_julia(self):
+        grid = plane(Q, np.linspace(-1.5, 1.5, 6), np.linspace(-1.5, 1.5, 6), axes=(1, 2), origin=(0.1,))
+        c = (-0.2, 0.6, 0.2, 0.1)
+        counts = julia(Q, grid, c, exponent=3, max_iterations=20)
+        expected = [[reference(Q, c, z, 3) for z in row] for row in grid]
+        self.assertEqual(counts.tolist(), expected)
+
+    def test_chunks(self):
+        grid = plane(O, np.linspace(-2, 1, 9), np.linspace(-1, 1, 9), axes=(0, 5))
+        whole = escape_time(O, grid, max_iterations=30)
+        chunked = escape_time(O, grid, max_iterations=30, chunk_size=7)
+        self.assertEqual(whole.tolist(), chunked.tolist())
+
+    def test_dtypes(self):
+        grid = plane(Q, np.linspace(-2, 1, 9), np.linspace(-1, 1, 9), axes=(0, 3))
+        expected = escape_time(Q, grid, max_iterations=20)
+        self.assertEqual(escape_time(Q, grid, max_iterations=20, dtype=np.complex128).tolist(), expected.tolist())
+        self.assertEqual(escape_time(Q, grid, max_iterations=20, dtype=np.float32).tolist(), expected.tolist())
+        self.assertEqual(escape_time(Q, grid, max_iterations=20, dtype=np.complex64).tolist(), expected.tolist())
+
+        # Points near the boundary of the set may escape on different iterations at lower precision.
+        grid = plane(Q, np.linspace(-2, 1, 60), np.linspace(-1, 1, 40), axes=(0, 3))
+        expected = escape_time(Q, grid, max_iterations=50)
+        for dtype in (np.float32, np.complex64):
+            mismatches = np.count_nonzero(escape_time(Q, grid, max_iterations=50, dtype=dtype) != expected)
+            self.assertLess(mismatches, expected.size // 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
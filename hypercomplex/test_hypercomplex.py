@@ -196,6 +196,28 @@ class TestHypercomplex(unittest.TestCase):
         self.assertEqual((1 / s1) * (1 / s2), 0)
         self.assertRaises(ZeroDivisionError, lambda: 1 / (s1 * s2))
 
+    def test_scalar_multiply(self):
+        self.assertEqualT(Q(1, 2, 3, 4) * 2.0, Q(2, 4, 6, 8))
+        self.assertEqualT(2.0 * Q(1, 2, 3, 4), Q(2, 4, 6, 8))
+        self.assertEqualT(R(3) * O(1, 2), O(3, 6))
+
+    def test_karatsuba(self):
+        from fractions import Fraction
+        for base in (int, Fraction):
+            for level in range(1, 7):
+                standard = cayley_dickson_algebra(level, base)
+                karatsuba = cayley_dickson_algebra(level, base, karatsuba_level=1)
+                self.assertTrue(karatsuba.karatsuba)
+                x = [base((7 * i) % 11 - 5) for i in range(2**level)]
+                y = [base((3 * i) % 13 - 6) for i in range(2**level)]
+                self.assertEqual((karatsuba(*x) * karatsuba(*y)).coefficients(),
+                                 (standard(*x) * standard(*y)).coefficients())
+        mixed = cayley_dickson_algebra(5, karatsuba_level=4)
+        self.assertEqual([mixed.karatsuba, cd_construction(mixed).karatsuba], [True, False])
+        x, y = P(*range(32)) / 10, P(*range(32, 0, -1)) / 10
+        for a, b in zip((mixed(x) * mixed(y)).coefficients(), (x * y).coefficients()):
+            self.assertAlmostEqual(a, b)
+
 
 if __name__ == "__main__":
     print('Running tests from main...')
@@ -0,0 +1,123 @@
+"""Test suite for lazy.py."""
+
+import unittest
+import tracemalloc
+from decimal import Decimal
+from hypercomplex import R, C, Q, O, S, cayley_dickson_algebra
+
+try:
+    import numpy as np
+    from hypercomplex import arrays
+    from hypercomplex.lazy import lazy, Expression
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestLazy(unittest.TestCase):
+
+    def test_numbers(self):
+        a, b, c, d, e = Q(1, 2, 3, 4), O(0.5, 1, -1, 2, 3), C(2, -1), Q(0, 0, 1, 1), S(1, 1, 1, 1, 1, 1, 1, 1, 1)
+        expression = lazy(a) * b + c * d - e.conjugate()
+        self.assertIsInstance(expression, Expression)
+        result = expression.evaluate()
+        self.assertEqual(result, a * b + c * d - e.conjugate())
+        self.assertIs(type(result), S)
+
+    def test_operators(self):
+        a = Q(1, 2, 3, 4)
+        x = lazy(a)
+        self.assertEqual((2 * x - 3).evaluate(), 2 * a - 3)
+        self.assertEqual((-x).evaluate(), -a)
+        self.assertEqual((+x).evaluate(), a)
+        self.assertEqual((x + 1j).evaluate(), a + 1j)
+        self.assertEqual((1j - x).evaluate(), 1j - a)
+        self.assertEqual((C(1, 1) * x).evaluate(), C(1, 1) * a)
+        self.assertEqual((x - x * x).evaluate(), a - a * a)
+        self.assertEqual(x.norm_squared().evaluate(), a.norm_squared())
+
+    def test_norm_pattern(self):
+        b = O(0.5, 1, -1, 2, 3)
+        x = lazy(b)
+        self.assertEqual((x.conjugate() * x).evaluate(), b.norm_squared())
+        self.assertEqual((x * x.conjugate() + 1).evaluate(), b.norm_squared() + 1)
+        self.assertEqual((lazy(b).conjugate() * lazy(b)).evaluate(), O(b.norm_squared()))
+        self.assertIs(type((x.conjugate() * x).evaluate()), O)
+
+    def test_norm_rewrite(self):
+        x = lazy(np.random.default_rng(0).normal(size=(100000, 8)))
+        expression = x.conjugate() * x
+        self.assertEqual([node.operation for node in expression.rewritten().nodes()], ['leaf', 'norm_squared'])
+        used = x.conjugate()
+        self.assertIn('conjugate', [node.operation for node in (used * x + used).rewritten().nodes()])
+
+        tracemalloc.start()
+        expression.evaluate()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        array = x.operands[0]
+        self.assertLess(peak, 1.5 * array.nbytes)  # A conjugate temporary alone would be array.nbytes.
+
+    def test_deep(self):
+        total = lazy(Q())
+        for i in range(3000):
+            total = total + Q(i)
+        self.assertEqual(total.evaluate(), Q(sum(range(3000))))
+
+    def test_complex_leaf(self):
+        self.assertEqual((lazy(R(1)) + 1j).evaluate(), R(1) + 1j)
+        self.assertIs(type((lazy(R(1)) + 1j).evaluate()), complex)
+        self.assertEqual((lazy(C(1, 2)) * 1j).evaluate(), C(1, 2) * 1j)
+
+    def test_bases(self):
+        Z = cayley_dickson_algebra(2, int)
+        a, b = Z(10**20 + 1, 1), Z(1, 1)
+        result = (lazy(a) * b - lazy(a).conjugate()).evaluate()
+        self.assertEqual(result.coefficients(), (a * b - a.conjugate()).coefficients())
+        self.assertEqual(result.coefficients(), (-1, 10**20 + 3, 0, 0))
+        self.assertIs(type(result.real_coefficient()), int)
+
+        D = cayley_dickson_algebra(1, Decimal)
+        result = (lazy(D(Decimal('0.1'), 1)) + D(Decimal('0.2'))).evaluate()
+        self.assertEqual(result.coefficients(), (Decimal('0.3'), Decimal(1)))
+
+        K = cayley_dickson_algebra(1, complex)
+        x = K(1 + 2j, 3j)
+        self.assertEqual((lazy(x) * x - lazy(x).conjugate()).evaluate(), x * x - x.conjugate())
+        self.assertEqual((lazy(x).conjugate() * lazy(x)).evaluate(), x.conjugate() * x)
+
+    def test_shared(self):
+        a, b = Q(1, 2, 3, 4), Q(0, 1, 0, -1)
+        product = lazy(a) * b
+        conjugate = product.conjugate()
+        self.assertEqual((product + product - conjugate).evaluate(), a * b + a * b - (a * b).conjugate())
+
+    def test_arrays(self):
+        rng = np.random.default_rng(0)
+        a, b = rng.normal(size=(2, 5, 8))
+        original = a.copy()
+        result = (lazy(a) * b + lazy(b) * a - lazy(a).conjugate()).evaluate()
+        expected = arrays.multiply(a, b) + arrays.multiply(b, a) - arrays.conjugate(a)
+        np.testing.assert_allclose(result, expected)
+        np.testing.assert_array_equal(a, original)
+
+        x = lazy(a)
+        result = (x.conjugate() * x + Q(1, 2)).evaluate()
+        self.assertEqual(result.shape, (5, 8))
+        np.testing.assert_allclose(result[:, 0], arrays.norm_squared(a) + 1)
+        np.testing.assert_allclose(result[:, 1:], [[2, 0, 0, 0, 0, 0, 0]] * 5)
+
+    def test_complex_pairs(self):
+        rng = np.random.default_rng(1)
+        a, b = rng.normal(size=(2, 3, 16))
+        pairs = arrays.to_pairs(a)
+        result = (lazy(pairs) * arrays.to_pairs(b) - 2 * lazy(pairs).norm_squared() + O(1, 2, 3)).evaluate()
+        expected = arrays.multiply(a, b)
+        expected[:, 0] -= 2 * arrays.norm_squared(a)
+        expected[:, :3] += [1, 2, 3]
+        self.assertEqual(result.dtype, np.complex128)
+        np.testing.assert_allclose(arrays.from_pairs(result), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
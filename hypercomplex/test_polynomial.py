@@ -0,0 +1,71 @@
+"""Test suite for polynomial.py."""
+
+import unittest
+from hypercomplex import C, Q, O, S, cayley_dickson_algebra
+from hypercomplex.polynomial import Polynomial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def naive(polynomial, x):
+    if polynomial.right:
+        return sum((x**k * c for k, c in enumerate(polynomial.coefficients)), polynomial.algebra())
+    return sum((c * x**k for k, c in enumerate(polynomial.coefficients)), polynomial.algebra())
+
+
+class TestPolynomial(unittest.TestCase):
+
+    def assertClose(self, a, b):
+        for p, q in zip(a.coefficients(), b.coefficients()):
+            self.assertAlmostEqual(p, q)
+
+    def test_basics(self):
+        p = Polynomial(Q, 1, Q(0, 1), 0, 2)
+        self.assertEqual(p.degree, 3)
+        self.assertEqual(Polynomial(C).degree, 0)
+        self.assertEqual(p(0), 1)
+        self.assertEqual(p(1), Q(3, 1))
+        self.assertEqual(Polynomial(C, 1, 0, 1)(1j), 0)
+
+    def test_exact(self):
+        Z = cayley_dickson_algebra(3, int)
+        p = Polynomial(Z, Z(1, -2, 3), 4, Z(0, 0, 5, 6, 7), Z(-1, 1, -1, 1, -1, 1, -1, 1))
+        x = Z(2, 1, 0, -1, 3)
+        self.assertEqual(p(x), naive(p, x))
+
+    def test_sides(self):
+        for T in (Q, O, S):  # Sedenions are not alternative but still power associative.
+            coefficients = [T(*range(k, k + T.dimensions)) / 10 for k in range(4)]
+            x = T(*[(-1)**k / (k + 1) for k in range(T.dimensions)])
+            left, right = Polynomial(T, *coefficients), Polynomial(T, *coefficients, right=True)
+            self.assertClose(left(x), naive(left, x))
+            self.assertClose(right(x), naive(right, x))
+            self.assertNotEqual(left(x), right(x))
+
+    def test_derivative(self):
+        p = Polynomial(Q, 5, Q(1, 2, 3, 4), 0, Q(0, 1, 1))
+        self.assertEqual(p.derivative().coefficients, (Q(1, 2, 3, 4), 0, Q(0, 3, 3)))
+        self.assertEqual(Polynomial(Q, 5).derivative().coefficients, (0,))
+        x = Q(0.5, 0.25, -1, 2)
+        value, slope = p.evaluate(x, derivative=True)
+        self.assertClose(value, naive(p, x))
+        self.assertClose(slope, naive(p.derivative(), x))
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_evaluate_array(self):
+        points = np.random.default_rng(0).normal(size=(3, 2, 8))
+        for right in (False, True):
+            p = Polynomial(O, O(1, 2, 3), 0, O(0, 0, 0, 0, 4), O(1, 1, 1, 1, 1, 1, 1, 1), right=right)
+            values, slopes = p.evaluate_array(points, derivative=True)
+            self.assertEqual(values.shape, (3, 2, 8))
+            for point, value, slope in zip(points.reshape(-1, 8), values.reshape(-1, 8), slopes.reshape(-1, 8)):
+                self.assertClose(O(*value), p(O(*point)))
+                self.assertClose(O(*slope), p.derivative()(O(*point)))
+        self.assertEqual(Polynomial(C, 3).evaluate_array(points[..., :2]).shape, (3, 2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
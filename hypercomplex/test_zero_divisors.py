@@ -0,0 +1,71 @@
+"""Test suite for zero_divisors.py."""
+
+import time
+import unittest
+from hypercomplex import Q, O, S, X
+from hypercomplex.hypercomplex import cayley_dickson_signs
+from hypercomplex.zero_divisors import candidates, zero_divisors, search_chunk, left_products, is_zero_product
+
+
+class TestZeroDivisors(unittest.TestCase):
+
+    def test_e_signs(self):
+        for T in (Q, O, S):
+            signs = T.e_signs()
+            for i in range(T.dimensions):
+                for j in range(T.dimensions):
+                    self.assertEqual(T.e(i) * T.e(j), signs[i][j] * T.e(i ^ j))
+
+    def test_candidates(self):
+        self.assertEqual(list(candidates(4)), [((1, 1), (2, 1)), ((1, 1), (2, -1)), ((1, 1), (3, 1)),
+                                               ((1, 1), (3, -1)), ((2, 1), (3, 1)), ((2, 1), (3, -1))])
+        self.assertEqual(len(list(candidates(8, 3, True))), 56 * 4)
+
+    def test_none_below_sedenions(self):
+        self.assertEqual(list(zero_divisors(Q)), [])
+        self.assertEqual(list(zero_divisors(O)), [])
+
+    def test_sedenions(self):
+        pairs = list(zero_divisors(S))
+        self.assertTrue(pairs)
+        self.assertIn((S.e(5) + S.e(10), S.e(6) + S.e(9)), pairs)
+        for x, y in pairs:
+            self.assertEqual(x * y, 0)
+
+    def test_raw(self):
+        pairs = list(zero_divisors(S, raw=True))
+        self.assertIn((((5, 1), (10, 1)), ((6, 1), (9, 1))), pairs)
+
+    def test_batched(self):
+        signs = cayley_dickson_signs(16)
+        for include_real in (False, True):
+            xs = ys = list(candidates(16, 2, include_real))
+            pairwise = [(x, y) for x in xs for y in ys if is_zero_product(left_products(x, signs), y)]
+            self.assertEqual(search_chunk(16, xs, 2, include_real), pairwise)
+
+    def test_include_real(self):
+        self.assertEqual(set(zero_divisors(S, raw=True)), set(zero_divisors(S, raw=True, include_real=True)))
+        for x, y in zero_divisors(S, 3, include_real=True):
+            self.assertEqual(x * y, 0)
+
+    def test_parallel(self):
+        serial = set(zero_divisors(S, raw=True))
+        parallel = set(zero_divisors(S, raw=True, processes=2, chunk_size=20))
+        self.assertEqual(serial, parallel)
+
+    def test_parallel_close(self):
+        start = time.perf_counter()
+        for _ in zero_divisors(X, raw=True):
+            pass
+        serial_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pairs = zero_divisors(X, processes=2)
+        x, y = next(pairs)
+        pairs.close()
+        self.assertEqual(x * y, 0)
+        self.assertLess(time.perf_counter() - start, serial_seconds / 2)  # The rest of the search was cancelled.
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Provides a fast search for pairs of hypercomplex numbers made of signed unit combinations whose product is zero."""
+
+from itertools import combinations, product, islice
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from hypercomplex.hypercomplex import cayley_dickson_signs
+
+
+def candidates(dimensions, terms=2, include_real=False):
+    """Generates candidates as tuples of (index, sign) pairs, e.g. ((5, 1), (10, 1)) for e(5) + e(10).
+
+    The first sign is always 1 since scaling a zero divisor by -1 gives another zero divisor."""
+    start = 0 if include_real else 1
+    for indices in combinations(range(start, dimensions), terms):
+        for signs in product((1, -1), repeat=terms - 1):
+            yield tuple(zip(indices, (1,) + signs))
+
+
+def left_products(x, signs):
+    """Returns the list of x*e(j) for every unit e(j) as sparse {index: coefficient} dicts."""
+    rows = []
+    for j in range(len(signs)):
+        row = {}
+        for i, s in x:
+            k = i ^ j
+            row[k] = row.get(k, 0) + s * signs[i][j]
+        rows.append(row)
+    return rows
+
+
+def is_zero_product(rows, y):
+    """Checks if x*y is zero given the left_products rows of x."""
+    total = {}
+    for j, t in y:
+        for k, value in rows[j].items():
+            total[k] = total.get(k, 0) + t * value
+    return not any(total.values())
+
+
+def row_key(row, scale=1):
+    """Returns a hashable form of scale times a left_products row."""
+    return tuple(sorted((k, scale * value) for k, value in row.items() if value))
+
+
+def two_term_zero_products(rows, start):
+    """Returns every two term y = e(j) + t*e(k) with x*y == 0, in candidates order, given the left_products rows of x.
+
+    x*y == 0 exactly when x*e(k) == -t * x*e(j), so all the y's are tested at once by looking up each row's negation and
+    itself in a table of the rows rather than checking every pair."""
+    table = {}
+    for k in range(start, len(rows)):
+        table.setdefault(row_key(rows[k]), []).append(k)
+    found = []
+    for j in range(start, len(rows)):
+        matches = [(k, t) for t in (1, -1) for k in table.get(row_key(rows[j], -t), ()) if k > j]
+        found.extend(((j, 1), (k, t)) for k, t in sorted(matches, key=lambda match: (match[0], -match[1])))
+    return found
+
+
+def search_chunk(dimensions, xs, terms, include_real=False):
+    """Returns all the (x, y) candidate pairs with x*y == 0 where x is in xs.
+
+    Two term y's are tested against each x all at once with two_term_zero_products. Other y's are checked one pair at a
+    time with is_zero_product since a sum of more than two rows can cancel in too many ways to look up."""
+    signs = cayley_dickson_signs(dimensions)
+    ys = None if terms == 2 else list(candidates(dimensions, terms, include_real))
+    found = []
+    for x in xs:
+        rows = left_products(x, signs)
+        if ys is None:
+            found.extend((x, y) for y in two_term_zero_products(rows, 0 if include_real else 1))
+        else:
+            found.extend((x, y) for y in ys if is_zero_product(rows, y))
+    return found
+
+
+def chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def to_number(algebra, candidate):
+    coefficients = [algebra.base()()] * algebra.dimensions
+    for index, sign in candidate:
+        coefficients[index] = algebra.base()(sign)
+    return algebra(*coefficients)
+
+
+def zero_divisors(algebra, terms=2, processes=1, chunk_size=64, raw=False, include_real=False):
+    """Generates the pairs (x, y) of algebra numbers with x*y == 0 where x and y are sums of terms signed units.
+
+    The units are e(1) and up, or e(0) and up if include_real is True. Results are yielded as soon as each chunk of x's
+    is searched. With processes > 1 the chunks are searched in parallel and arrive in no particular order, with only
+    2*processes chunks queued at a time so stopping early, e.g. with break, also stops the search. Set raw=True to get
+    the (index, sign) candidate tuples instead."""
+    dimensions = algebra.dimensions
+    chunks = chunked(candidates(dimensions, terms, include_real), chunk_size)
+
+    def convert(pairs):
+        for x, y in pairs:
+            yield (x, y) if raw else (to_number(algebra, x), to_number(algebra, y))
+
+    if processes == 1:
+        for chunk in chunks:
+            yield from convert(search_chunk(dimensions, chunk, terms, include_real))
+        return
+
+    with ProcessPoolExecutor(processes) as executor:
+        pending = set()
+        try:
+            while True:
+                for chunk in islice(chunks, 2 * processes - len(pending)):
+                    pending.add(executor.submit(search_chunk, dimensions, chunk, terms, include_real))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from convert(future.result())
+        finally:  # Only chunks already running are waited for when the generator is closed early.
+            for future in pending:
+                future.cancel()
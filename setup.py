@@ -22,6 +22,7 @@ setup(
     packages=['hypercomplex'],
     python_requires='>=3.6',
     install_requires=['mathdunders>=0.4.1'],
+    extras_require={'numpy': ['numpy']},
     license="MIT",
     keywords=['python', 'math', 'complex', 'number', 'hypercomplex', 'Cayley', 'Dickson', 'construction',
               'algebra', 'quaternion', 'octonion', 'sedenion', 'pathion', 'chingon', 'routon', 'voudon'],